@@ -1,9 +1,13 @@
 import fnmatch
-import glob
+import functools
+import itertools
 import logging
 import os
 import re
+import string
+import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from collections.abc import Generator
 
@@ -11,6 +15,12 @@ import numpy as np
 import pandas as pd
 import parse
 
+try:
+    # optional: linear-time regex engine without backtracking
+    import re2
+except ImportError:
+    re2 = None
+
 from filefisher._utils import (
     _find_keys,
     natural_keys,
@@ -39,6 +49,271 @@ def _deprecate_allow_empty(**kwargs):
 _RESERVED_PLACEHOLDERS = {"keys", "on_parse_error", "on_empty", "_allow_empty"}
 
 
+# chars that make a pattern segment non-literal for fnmatch (as in glob)
+_MAGIC_CHECK = re.compile(r"[*?[]")
+
+
+def _scan_entries(path) -> list[os.DirEntry]:
+    """list a directory via os.scandir - unreadable directories yield no entries"""
+
+    try:
+        with os.scandir(path or ".") as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+
+def _num_workers() -> int:
+    """number of threads used to scan sibling directories
+
+    Overlapping the directory reads hides per-syscall latency, which pays off
+    most on network filesystems. Can be overridden with the
+    ``FILEFISHER_NUM_WORKERS`` environment variable (1 disables threading).
+    """
+
+    num_workers = os.environ.get("FILEFISHER_NUM_WORKERS")
+
+    if num_workers is not None:
+        return int(num_workers)
+
+    return min(8, (os.cpu_count() or 1) * 2)
+
+
+def _match_segment(candidate, part, want_dir) -> list[str]:
+    """entries of the `candidate` directory matching the pattern segment"""
+
+    found = []
+    for entry in _scan_entries(candidate):
+
+        name = entry.name
+
+        # as in glob: hidden entries only match hidden patterns
+        if name.startswith(".") and not part.startswith("."):
+            continue
+
+        if not fnmatch.fnmatch(name, part):
+            continue
+
+        if want_dir and not entry.is_dir():
+            continue
+
+        found.append(os.path.join(candidate, name))
+
+    return found
+
+
+def _scandir_glob(pattern) -> list[str]:
+    """find paths matching a pathname pattern using os.scandir
+
+    Drop-in replacement for ``glob.glob`` that matches each pattern segment
+    against the ``DirEntry`` objects of the parent directory. This avoids the
+    extra ``stat`` call per entry - ``DirEntry.is_dir`` is answered from the
+    directory listing itself.
+
+    Notes
+    -----
+    Patterns are split on ``os.path.sep`` only - unlike ``glob.glob``,
+    ``/``-separated patterns are not supported on Windows.
+    """
+
+    sep = os.path.sep
+
+    if not pattern:
+        return []
+
+    dironly = pattern.endswith(sep)
+
+    if not _MAGIC_CHECK.search(pattern):
+        # literal pattern: a single existence check - exactly like glob this
+        # returns the pattern verbatim (preserving e.g. doubled separators)
+        exists = os.path.isdir if dironly else os.path.lexists
+        return [pattern] if exists(pattern) else []
+
+    parts = pattern.rstrip(sep).split(sep)
+
+    # glob keeps the literal dirname before the first wildcard verbatim
+    # (doubled separators survive there) but expands the rest component by
+    # component, which collapses empty segments - mirror that
+    first_magic = next(i for i, part in enumerate(parts) if _MAGIC_CHECK.search(part))
+
+    prefix = sep.join(parts[:first_magic]).rstrip(sep)
+    if not prefix and pattern.startswith(sep):
+        # all-separator prefix: the (possibly doubled) root
+        prefix = pattern[: len(pattern) - len(pattern.lstrip(sep))]
+
+    parts = [part for part in parts[first_magic:] if part != ""]
+
+    candidates = [prefix]  # "" means the cwd
+
+    for depth, part in enumerate(parts):
+
+        want_dir = dironly or depth < len(parts) - 1
+        found = []
+
+        if not _MAGIC_CHECK.search(part):
+            # literal segment: a direct existence check avoids listing the
+            # directory - descends only into the matching subtree
+            exists = os.path.isdir if want_dir else os.path.lexists
+            for candidate in candidates:
+                path = os.path.join(candidate, part)
+                if exists(path):
+                    found.append(path)
+
+            candidates = found
+            if not candidates:
+                return []
+            continue
+
+        num_workers = min(_num_workers(), len(candidates))
+        if num_workers > 1:
+            # scan sibling directories concurrently - the GIL is released
+            # during the I/O so the reads overlap
+            scan = functools.partial(_match_segment, part=part, want_dir=want_dir)
+            with ThreadPoolExecutor(num_workers) as pool:
+                found = list(itertools.chain.from_iterable(pool.map(scan, candidates)))
+        else:
+            for candidate in candidates:
+                found += _match_segment(candidate, part, want_dir)
+
+        candidates = found
+        if not candidates:
+            return []
+
+    if dironly:
+        candidates = [candidate + sep for candidate in candidates]
+
+    return candidates
+
+
+@functools.lru_cache(maxsize=512)
+def _compiled_parser(pattern: str) -> parse.Parser:
+    """compile a pattern to a parse.Parser - memoized
+
+    Building a Parser is dominated by the regex compilation; caching amortizes this
+    cost when many FileFinders are created with recurring patterns.
+    """
+
+    return parse.compile(pattern)
+
+
+def _compile_name_template(pattern: str):
+    """specialize a format string into a fast name builder
+
+    ``str.format`` re-interprets its template on every call; splitting the
+    pattern into (literal, field) segments once reduces name creation to dict
+    lookups and a join. Falls back to ``str.format`` for anything but plain
+    named fields.
+    """
+
+    try:
+        segments = list(string.Formatter().parse(pattern))
+    except ValueError:
+        segments = None
+
+    if segments is None or any(
+        spec or conversion or not field.isidentifier()
+        for _, field, spec, conversion in segments
+        if field is not None
+    ):
+        return lambda keys: pattern.format(**keys)
+
+    def create_name(keys) -> str:
+
+        parts = []
+        for literal, field, _, _ in segments:
+            if literal:
+                parts.append(literal)
+            if field is not None:
+                parts.append(format(keys[field]))
+
+        return "".join(parts)
+
+    return create_name
+
+
+class _Re2Match:
+    """adapt a re2 match to the parts of the re.Match interface parse uses
+
+    google-re2 match objects only accept integer group references in ``span``;
+    ``parse.Parser.evaluate_result`` looks spans up by group name.
+    """
+
+    __slots__ = ("_match", "_groupindex")
+
+    def __init__(self, match, groupindex):
+        self._match = match
+        self._groupindex = groupindex
+
+    def groups(self):
+        return self._match.groups()
+
+    def groupdict(self):
+        return self._match.groupdict()
+
+    def group(self, *groups):
+        return self._match.group(*groups)
+
+    def span(self, group=0):
+        return self._match.span(self._groupindex.get(group, group))
+
+
+class _Re2Matcher:
+    """adapt a compiled re2 pattern to the interface _parse_paths uses"""
+
+    __slots__ = ("_regex", "_groupindex")
+
+    def __init__(self, regex):
+        self._regex = regex
+        self._groupindex = regex.groupindex
+
+    def match(self, string):
+        matched = self._regex.match(string)
+
+        if matched is None:
+            return None
+
+        return _Re2Match(matched, self._groupindex)
+
+
+def _match_regex(parser: parse.Parser):
+    """regex used to match paths against a compiled parse pattern
+
+    Uses the DFA-based re2 engine when available - it guarantees a single
+    linear-time pass per path. Falls back to the (backtracking) re regex
+    built by parse. Extracting the named fields stays with parse either way.
+    """
+
+    match_re = parser._match_re
+
+    if re2 is not None:
+        pattern = match_re.pattern
+        # parse anchors its regex as \A...\Z; re2 only knows \z, which is
+        # what \Z means in python re (absolute end of the string)
+        if pattern.endswith(r"\Z"):
+            pattern = pattern[:-2] + r"\z"
+
+        flags = match_re.flags & ~re.UNICODE
+        if flags & ~(re.IGNORECASE | re.DOTALL):
+            # flags we cannot map onto re2 options
+            return match_re
+
+        # matching must not depend on the installed engine - carry the flags
+        # parse compiled with (case-insensitive, dot matches newlines) to re2
+        options = re2.Options()
+        options.case_sensitive = not flags & re.IGNORECASE
+        options.dot_nl = bool(flags & re.DOTALL)
+        # don't log unsupported patterns (e.g. backreferences) to stderr
+        options.log_errors = False
+
+        try:
+            return _Re2Matcher(re2.compile(pattern, options=options))
+        except re2.error:
+            # not all re constructs are supported by re2
+            pass
+
+    return match_re
+
+
 def _assert_valid_keys(keys) -> None:
 
     for key in _RESERVED_PLACEHOLDERS:
@@ -48,6 +323,15 @@ def _assert_valid_keys(keys) -> None:
 
 def _assert_unique(df) -> None:
 
+    # hash_pandas_object raises on frames without columns (i.e. patterns
+    # without placeholders); duplicated() treats those as all-unique below
+    if df.shape[1]:
+        # vectorized pre-check: equal rows hash equal, so all-unique row
+        # hashes prove uniqueness without the more expensive duplicated()
+        hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        if len(np.unique(hashes)) == len(hashes):
+            return
+
     duplicates = df.duplicated()
 
     if duplicates.any():
@@ -63,7 +347,7 @@ class _FinderBase:
         self.pattern = pattern
         self.keys = _find_keys(pattern)
         _assert_valid_keys(self.keys)
-        self.parser = parse.compile(self.pattern)
+        self.parser = _compiled_parser(self.pattern)
 
         if self.parser.fixed_fields:
             msg = (
@@ -72,6 +356,7 @@ class _FinderBase:
             )
             raise ValueError(msg)
 
+        self._match_re = _match_regex(self.parser)
         self._suffix = suffix
 
         # replace the fmt spec - add the capture group again
@@ -79,6 +364,8 @@ class _FinderBase:
             r"\{([A-Za-z0-9_]+)(:.*?)\}", r"{\1}", pattern
         )
 
+        self._create_name = _compile_name_template(self._pattern_no_fmt_spec)
+
     def create_name(self, keys=None, **keys_kwargs) -> str:
         """build name from keys
 
@@ -93,7 +380,7 @@ class _FinderBase:
 
         keys = update_dict_with_kwargs(keys, **keys_kwargs)
 
-        return self._pattern_no_fmt_spec.format(**keys)
+        return self._create_name(keys)
 
 
 class _Finder(_FinderBase):
@@ -128,7 +415,8 @@ class _Finder(_FinderBase):
 
         Notes
         -----
-        Missing ``keys`` are replaced with ``"*"``.
+        Missing ``keys`` are replaced with ``"*"``. Passing ``None`` as condition
+        ignores it, i.e., it is treated as ``"*"`` as well.
 
         """
 
@@ -146,6 +434,14 @@ class _Finder(_FinderBase):
                 f"Unknown value for 'on_empty': '{on_empty}'. Must be one of 'raise', 'warn' or 'allow'."
             )
 
+        # "*" and None filters equal the default wildcard - drop them so they
+        # don't multiply the search patterns below
+        keys = {
+            key: value
+            for key, value in keys.items()
+            if np.ndim(value) != 0 or value not in (None, "*")
+        }
+
         # wrap strings and scalars in list
         for key, value in keys.items():
             if isinstance(value, str) or np.ndim(value) == 0:
@@ -194,7 +490,8 @@ class _Finder(_FinderBase):
 
         Notes
         -----
-        Missing ``keys`` are replaced with ``"*"``.
+        Missing ``keys`` are replaced with ``"*"``. Passing ``None`` as condition
+        ignores it, i.e., it is treated as ``"*"`` as well.
 
         Raises
         ------
@@ -223,13 +520,23 @@ class _Finder(_FinderBase):
 
         """
 
-        return glob.glob(pattern)
+        return _scandir_glob(pattern)
 
     def _parse_paths(self, paths, on_parse_error) -> pd.DataFrame:
 
-        valid_paths, out = list(), list()
+        # hoist the lookups out of the loop - it runs for every candidate path
+        match = self._match_re.match
+        evaluate_result = self.parser.evaluate_result
+        suffix = self._suffix
+
+        # build the columns directly (one list per key) - avoids materializing
+        # a row-wise list of lists that pandas re-pivots to columnar storage
+        valid_paths = list()
+        columns: dict[str, list] = {key: [] for key in self.keys}
+
         for path in paths:
-            parsed = self.parser.parse(path)
+            matched = match(path)
+            parsed = evaluate_result(matched) if matched is not None else None
 
             if parsed is None:
                 if on_parse_error == "raise":
@@ -245,11 +552,23 @@ class _Finder(_FinderBase):
                 elif on_parse_error == "ignore":
                     pass
             else:
-                valid_paths.append(path)
-                out.append(list(parsed.named.values()))
-
-        index = pd.Index(valid_paths, name="path") + self._suffix
-        df = pd.DataFrame(out, columns=self.keys, index=index)
+                valid_paths.append(path + suffix)
+                named = parsed.named
+                for key in self.keys:
+                    value = named[key]
+                    # metadata repeats a small set of values (model, scenario,
+                    # ...) - interning makes the duplicates share one str object
+                    if type(value) is str:
+                        value = sys.intern(value)
+                    columns[key].append(value)
+
+        index = pd.Index(valid_paths, name="path")
+
+        if not valid_paths:
+            # dtypes cannot be inferred from empty columns
+            return pd.DataFrame([], columns=self.keys, index=index)
+
+        df = pd.DataFrame(columns, index=index)
         return df
 
 
@@ -304,7 +623,9 @@ class FileFinder:
             if isinstance(test_paths, str):
                 test_paths = [test_paths]
 
-            if len(test_paths) != len(set(test_paths)):
+            # normalize trailing separators so "a" and "a/" count as duplicates
+            normed = [path.rstrip(os.path.sep) for path in test_paths]
+            if len(normed) != len(set(normed)):
                 raise ValueError("`test_paths` are not unique")
 
             self._set_test_paths(test_paths)
@@ -313,7 +634,19 @@ class FileFinder:
 
         self._test_paths = test_paths
 
+        # only paths under the literal (placeholder-free) directory prefix of
+        # the pattern can ever match - filter the rest out once instead of at
+        # every find_* call
+        prefix = self._full_pattern.split("{", 1)[0]
+        prefix = prefix[: prefix.rfind(os.path.sep) + 1]
+
+        if prefix and not _MAGIC_CHECK.search(prefix):
+            test_paths = [path for path in test_paths if path.startswith(prefix)]
+
         # use fnmatch.filter to 'glob' pseudo-filenames
+        # `test_paths` is fixed per instance, so the result only depends on the
+        # pattern - memoize it for repeated find_* calls
+        @functools.lru_cache(maxsize=128)
         def finder(pat):
 
             # make fnmatch work (almost) the same as glob
@@ -443,7 +776,8 @@ class FileFinder:
 
         Notes
         -----
-        Missing ``keys`` are replaced with ``"*"``.
+        Missing ``keys`` are replaced with ``"*"``. Passing ``None`` as condition
+        ignores it, i.e., it is treated as ``"*"`` as well.
 
         Examples
         --------
@@ -493,7 +827,8 @@ class FileFinder:
 
         Notes
         -----
-        Missing ``keys`` are replaced with ``"*"``.
+        Missing ``keys`` are replaced with ``"*"``. Passing ``None`` as condition
+        ignores it, i.e., it is treated as ``"*"`` as well.
 
         Examples
         --------
@@ -538,7 +873,8 @@ class FileFinder:
 
         Notes
         -----
-        Missing ``keys`` are replaced with ``"*"``.
+        Missing ``keys`` are replaced with ``"*"``. Passing ``None`` as condition
+        ignores it, i.e., it is treated as ``"*"`` as well.
 
         Raises
         ------
@@ -562,7 +898,8 @@ class FileFinder:
 
         Notes
         -----
-        Missing ``keys`` are replaced with ``"*"``.
+        Missing ``keys`` are replaced with ``"*"``. Passing ``None`` as condition
+        ignores it, i.e., it is treated as ``"*"`` as well.
 
         Raises
         ------
@@ -608,8 +945,7 @@ class FileContainer:
             stacklevel=2,
         )
 
-        for index, element in self.df.iterrows():
-            yield index, element.to_dict()
+        yield from self.items()
 
     def __getitem__(self, key):
 
@@ -635,8 +971,12 @@ class FileContainer:
 
     def items(self) -> Generator[tuple[str, dict[str, Any]], None, None]:
         """Return a generator of (path, metadata) tuples"""
-        for index, element in self.df.iterrows():
-            yield index, element.to_dict()
+
+        columns = self.df.columns.tolist()
+        # itertuples yields plain tuples - avoids creating a Series per row
+        rows = self.df.itertuples(index=False, name=None)
+        for index, row in zip(self.df.index, rows):
+            yield index, dict(zip(columns, row))
 
     def combine_by_key(self, keys=None, sep="."):
         """combine columns
@@ -681,7 +1021,19 @@ class FileContainer:
         if keys is None:
             keys = list(self.df.columns)
 
-        return self.df[list(keys)].apply(lambda x: sep.join(x.map(str)), axis=1)
+        # vectorized string concat - avoids a python-level join per row
+        # NaN stays missing under astype(str) - materialize it as str(nan) does
+        columns = [self.df[key].astype(str).fillna("nan") for key in keys]
+
+        if not columns:
+            # joining zero keys yields an empty string per row
+            return pd.Series("", index=self.df.index)
+
+        combined = columns[0]
+        for column in columns[1:]:
+            combined = combined + sep + column
+
+        return combined.rename(None)
 
     def search(self, **query) -> "FileContainer":
         """subset paths given a search query
@@ -785,12 +1137,20 @@ class FileContainer:
         # ignore None values
         query = {key: value for key, value in query.items() if value is not None}
 
-        sel = np.ones_like(self.df.index, dtype=bool)
+        if not query:
+            # copy - the result must not alias our own df
+            return self.df.copy()
+
+        masks = []
         for key, value in query.items():
-            # isin does not handle scalars
-            value = [value] if np.ndim(value) == 0 else value
+            column = self.df[key]
+            # scalar equality is one vectorized comparison - avoids isin
+            if np.ndim(value) == 0:
+                masks.append(column.to_numpy() == value)
+            else:
+                masks.append(column.isin(value).to_numpy())
 
-            sel &= self.df[key].isin(value)
+        sel = np.logical_and.reduce(masks)
 
         return self.df[sel]
 
@@ -1,8 +1,6 @@
 import itertools
 import re
 
-import pandas as pd
-
 
 def _find_keys(string):
     """find keys in a format string
@@ -25,7 +23,8 @@ def _find_keys(string):
     )
 
     keys = re.findall(pattern, string)
-    keys = tuple(pd.Series(keys).unique())
+    # dict.fromkeys deduplicates while preserving order
+    keys = tuple(dict.fromkeys(keys))
 
     return keys
 
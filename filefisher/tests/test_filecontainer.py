@@ -239,6 +239,21 @@ def test_fc_combine_by_keys(example_fc):
     expected = pd.Series(expected, index=example_fc.df.index)
 
 
+def test_fc_combine_by_keys_nan():
+
+    # NaN must combine as "nan" and not swallow the whole row
+
+    df = pd.DataFrame(
+        {"model": ["x", "y"], "num": [1.5, float("nan")]},
+        index=pd.Index(["file0", "file1"], name="path"),
+    )
+
+    result = FileContainer(df)._combine_by_keys()
+
+    expected = pd.Series(["x.1.5", "y.nan"], index=df.index)
+    pd.testing.assert_series_equal(result, expected)
+
+
 def test_filefinder_repr(example_fc):
 
     # NOTE: does not test the pd.DataFrame part of the repr
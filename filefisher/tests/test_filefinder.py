@@ -1,11 +1,12 @@
 import os
+import re
 import textwrap
 
 import pandas as pd
 import pytest
 
 from filefisher import FileFinder
-from filefisher._filefinder import _assert_unique
+from filefisher._filefinder import _assert_unique, _compiled_parser, _match_regex
 
 from . import assert_filecontainer_empty
 
@@ -78,6 +79,57 @@ def test_assert_unique():
     with pytest.raises(ValueError, match="Non-unique metadata detected"):
         _assert_unique(df)
 
+    # frames without columns (patterns without placeholders) pass the check
+    df = pd.DataFrame(index=pd.Index(["a", "b"], name="path"))
+    _assert_unique(df)
+
+
+def test_match_regex_re2():
+
+    pytest.importorskip("re2")
+
+    parser = _compiled_parser("{a}/{b:d}")
+    match_re = _match_regex(parser)
+
+    # ensure the re2 engine is used - no silent fallback to the re regex
+    assert not isinstance(match_re, re.Pattern)
+
+    matched = match_re.match("x/3")
+    assert matched is not None
+
+    # evaluate_result needs groups()/groupdict()/span(name) on the match
+    result = parser.evaluate_result(matched)
+    assert result.named == {"a": "x", "b": 3}
+
+    assert match_re.match("x/y") is None
+    # the translated \z anchors at the absolute end of the string
+    assert match_re.match("x/3\n") is None
+
+
+def test_match_regex_re2_flags():
+
+    pytest.importorskip("re2")
+
+    # matching must not depend on the engine: parse compiles case-insensitive
+    parser = _compiled_parser("A/{b}")
+    assert _match_regex(parser).match("a/x") is not None
+
+    # ... and with dot matching newlines
+    parser = _compiled_parser("{a}_end")
+    assert _match_regex(parser).match("x\ny_end") is not None
+
+
+def test_match_regex_re2_fallback_quiet(capfd):
+
+    pytest.importorskip("re2")
+
+    # repeated placeholders compile to a backreference re2 rejects - the
+    # fallback to re must not log to stderr
+    parser = _compiled_parser("{a}/{a}")
+    assert isinstance(_match_regex(parser), re.Pattern)
+
+    assert capfd.readouterr().err == ""
+
 
 @pytest.mark.parametrize("_allow_empty", (False, True))
 def test_deprecate_allow_empty(_allow_empty):
@@ -145,6 +197,10 @@ def test_test_path_assert_nonunique():
     with pytest.raises(ValueError, match="`test_paths` are not unique"):
         FileFinder("a", "", test_paths=["a/b", "a/b"])
 
+    # the same path with and without a trailing separator is a duplicate
+    with pytest.raises(ValueError, match="`test_paths` are not unique"):
+        FileFinder("a", "", test_paths=["a", "a/"])
+
 
 def test_file_pattern_no_sep():
 
@@ -535,6 +591,47 @@ def test_find_files_wildcard(tmp_path, test_paths, find_kwargs):
     pd.testing.assert_frame_equal(result.df, expected)
 
 
+def test_find_files_none_matches_any(tmp_path, test_paths):
+
+    path_pattern = tmp_path / "{a}/foo"
+    file_pattern = "{b}"
+
+    ff = FileFinder(
+        path_pattern=path_pattern, file_pattern=file_pattern, test_paths=test_paths
+    )
+
+    expected = {
+        "path": {
+            0: str(tmp_path / "a1/foo/file"),
+            1: str(tmp_path / "a2/foo/file"),
+        },
+        "a": {0: "a1", 1: "a2"},
+        "b": {0: "file", 1: "file"},
+    }
+    expected = pd.DataFrame.from_dict(expected).set_index("path")
+
+    # None conditions are ignored, i.e., match anything
+    result = ff.find_files(a=None)
+    pd.testing.assert_frame_equal(result.df, expected)
+
+    result = ff.find_files(a=None, b="file")
+    pd.testing.assert_frame_equal(result.df, expected)
+
+
+def test_find_files_wildcard_pattern_not_multiplied():
+
+    ff = FileFinder("{a}", "{b}", test_paths=["a/b"])
+
+    # an explicit "*" must not add a second search pattern
+    with pytest.raises(ValueError) as excinfo:
+        ff.find_files(a="*", b="XXX")
+
+    expected = (
+        "Found no files matching criteria. Tried the following pattern(s):\n- '*/XXX'"
+    )
+    assert str(excinfo.value) == expected
+
+
 @pytest.mark.parametrize(
     "find_kwargs",
     [{"a": ["a1", "a2"], "b": "file"}, {"a": ["a1", "a2"], "b": ["file", "bar"]}],
@@ -598,6 +695,25 @@ def test_find_files_one_of_several(tmp_path, test_paths, find_kwargs):
     pd.testing.assert_frame_equal(result.df, expected)
 
 
+def test_find_files_no_placeholders(tmp_path, test_paths):
+
+    # a pattern without placeholders yields a one-row frame without columns
+
+    path_pattern = tmp_path / "a1/foo"
+    file_pattern = "file"
+
+    ff = FileFinder(
+        path_pattern=path_pattern, file_pattern=file_pattern, test_paths=test_paths
+    )
+
+    expected = pd.DataFrame(
+        index=pd.Index([str(tmp_path / "a1/foo/file")], name="path")
+    )
+
+    result = ff.find_files()
+    pd.testing.assert_frame_equal(result.df, expected)
+
+
 def test_find_single_file(tmp_path, test_paths):
 
     path_pattern = tmp_path / "{a}/foo"
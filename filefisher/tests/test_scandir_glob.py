@@ -0,0 +1,115 @@
+import glob
+import os
+
+import pytest
+
+from filefisher._filefinder import _scandir_glob
+
+
+@pytest.fixture(scope="module")
+def tree(tmp_path_factory):
+    """
+    Creates the following temporary structure:
+    - a1/foo/file
+    - a2/foo/file
+    - .hidden/foo/file
+    - link -> a1 (symlink)
+    - broken -> missing (broken symlink)
+    """
+
+    tmp_path = tmp_path_factory.mktemp("scandir_glob")
+
+    for sub in ("a1/foo", "a2/foo", ".hidden/foo"):
+        d = tmp_path / sub
+        d.mkdir(parents=True)
+        (d / "file").write_text("")
+
+    os.symlink(tmp_path / "a1", tmp_path / "link")
+    os.symlink(tmp_path / "missing", tmp_path / "broken")
+
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        # wildcards
+        "*",
+        "*/",
+        "*/*/*",
+        "*/foo/file",
+        "*/foo/",
+        # literal segments
+        "a1/foo/file",
+        "a1/foo/",
+        "a1/*/file",
+        "a1/foo/missing",
+        "nope/*",
+        # hidden entries only match hidden patterns
+        ".*/foo/file",
+        ".hidden/*/file",
+        # symlinks - also broken ones
+        "link/foo/file",
+        "link/*/file",
+        "lin*",
+        "broken",
+        "broken/*",
+        "brok*/",
+    ],
+)
+def test_scandir_glob_same_as_glob(tree, pattern):
+
+    pattern = os.path.join(str(tree), pattern)
+
+    result = sorted(_scandir_glob(pattern))
+    expected = sorted(glob.glob(pattern))
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        # literal patterns are returned verbatim - doubled separators survive
+        "a1//foo",
+        "a1//foo/",
+        "a1//foo//file",
+        "a1/foo//",
+        # with wildcards glob collapses doubled separators
+        "*//foo/file",
+        "a1//*/file",
+        "*//foo/",
+    ],
+)
+def test_scandir_glob_doubled_separators(tree, pattern):
+
+    pattern = str(tree) + os.path.sep + pattern
+
+    result = sorted(_scandir_glob(pattern))
+    expected = sorted(glob.glob(pattern))
+
+    assert result == expected
+
+
+@pytest.mark.parametrize("tail", ["a1/foo/file", "a1/*", "*/foo/file", "*/foo/"])
+def test_scandir_glob_doubled_separator_before_tree(tree, tail):
+
+    # a doubled separator in the literal dirname before the first wildcard
+    # is preserved by glob - the tail is still expanded
+    pattern = str(tree) + os.path.sep * 2 + tail
+
+    result = sorted(_scandir_glob(pattern))
+    expected = sorted(glob.glob(pattern))
+
+    assert result == expected
+
+
+@pytest.mark.parametrize("pattern", [os.path.sep, os.path.sep * 2, os.path.sep * 3])
+def test_scandir_glob_root(pattern):
+
+    assert _scandir_glob(pattern) == glob.glob(pattern)
+
+
+def test_scandir_glob_empty_pattern():
+
+    assert _scandir_glob("") == []